@@ -1,3 +1,6 @@
+import random
+import sys
+
 x = [1, 2, 3, 4, 5]
 
 colors = [
@@ -9,11 +12,11 @@ colors = [
     "\033[96m",  # Cyan
 ]
 
-def color():
-    import random
-    return random.choice(colors)
+def colors_for(n):
+    return random.choices(colors, k=n)
 
-# Print each item in random color
-for i in x:
-    
-    print(color() + str(i*i))
+# Print each item in random color, written out in one go
+out = "".join(col + str(i*i) + "\n" for col, i in zip(colors_for(len(x)), x))
+out += "\033[0m"
+sys.stdout.write(out)
+sys.stdout.flush()